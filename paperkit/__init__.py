@@ -7,15 +7,51 @@ A complete solution for creating, converting, and formatting academic manuscript
 __version__ = "1.0.0"
 __author__ = "PaperKit Contributors"
 
-from .formatter import apply_formatting
-from .converter import convert_to_docx
-from .initializer import init_paper
-from .templates import get_template, list_templates
+from importlib import import_module
+
+# Public name -> defining module. Names are imported on first access so
+# that importing the package (e.g. for the CLI) does not load python-docx.
+_EXPORTS = {
+    'apply_formatting': 'formatter',
+    'release_models': 'formatter',
+    'session': 'formatter',
+    'convert_to_docx': 'converter',
+    'convert_many': 'converter',
+    'convert_batch': 'converter',
+    'init_paper': 'initializer',
+    'get_template': 'templates',
+    'list_templates': 'templates',
+}
+
+# Submodules the package used to import eagerly; still reachable as
+# attributes (paperkit.config, paperkit.formatter, ...)
+_SUBMODULES = ('config', 'converter', 'formatter', 'initializer', 'templates')
 
 __all__ = [
     'apply_formatting',
     'convert_to_docx',
+    'convert_many',
+    'convert_batch',
     'init_paper',
     'get_template',
     'list_templates',
+    'release_models',
+    'session',
 ]
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return import_module(f'.{name}', __name__)
+
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_SUBMODULES))
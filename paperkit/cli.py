@@ -3,12 +3,13 @@
 Command-line interface for Academic Paper Toolkit
 """
 
+import os
 import sys
-from pathlib import Path
-from .formatter import apply_formatting
-from .converter import convert_to_docx
-from .initializer import init_paper
-from .templates import print_templates
+import glob
+import argparse
+
+# Subcommand modules are imported inside each handler so that light
+# commands (help, templates) do not pay for importing python-docx.
 
 
 def print_help():
@@ -20,6 +21,8 @@ PaperKit - Academic manuscript toolkit
 Commands:
     init       Initialize a new paper with proper formatting
     convert    Convert LaTeX/Word to formatted Word document
+               (several .tex inputs are merged into one document)
+    batch      Convert many files in parallel (one output per input)
     format     Apply formatting to existing Word document
     templates  List available journal templates
     help       Show this help message
@@ -27,6 +30,10 @@ Commands:
 Usage:
     python -m paperkit init "Paper Title" [output.docx] [--template JOURNAL]
     python -m paperkit convert input.tex [output.docx]
+    python -m paperkit convert part1.tex part2.tex ... [output.docx]
+    python -m paperkit convert INPUT ... --output OUTPUT
+    python -m paperkit convert input.tex [output.docx] [--timeout SECONDS]
+    python -m paperkit batch DIR_OR_GLOB ... [--output-dir DIR] [--workers N]
     python -m paperkit format input.docx [output.docx]
     python -m paperkit templates
 
@@ -42,6 +49,12 @@ Examples:
     # Convert LaTeX to Word
     python -m paperkit convert manuscript.tex manuscript.docx
 
+    # Convert several LaTeX files (or a glob) into one Word document
+    python -m paperkit convert "chapters/*.tex" thesis.docx
+
+    # Convert every .tex file in a folder, each to its own Word document
+    python -m paperkit batch chapters/ --output-dir word/
+
     # Format existing Word document
     python -m paperkit format draft.docx formatted.docx
 
@@ -58,86 +71,202 @@ Configuration:
     """)
 
 
-def main():
+class _ArgumentParser(argparse.ArgumentParser):
+    """Argument parser that reports errors in the toolkit's own style."""
+
+    def error(self, message):
+        print(f"✗ Error: {message}")
+        print("Run 'python -m paperkit help' for usage")
+        sys.exit(1)
+
+
+def find_bibliography(input_file):
+    """
+    Look for a library.bib next to an input file.
+
+    Args:
+        input_file: Path to an input file
+
+    Returns:
+        str: Path to library.bib, or None if there is none
+    """
+    bib_file = os.path.join(os.path.dirname(input_file) or '.', "library.bib")
+    if os.path.exists(bib_file):
+        return bib_file
+    return None
+
+
+def cmd_templates(args):
+    """List available journal templates."""
+    from .templates import print_templates
+
+    print_templates()
+    return True
+
+
+def cmd_init(args):
+    """Initialize a new paper."""
+    from .initializer import init_paper
+
+    return init_paper(args.title, args.output, template=args.template)
+
+
+def cmd_convert(args):
+    """Convert LaTeX/Word input(s) to a formatted Word document."""
+    from .converter import convert_to_docx, convert_many
+
+    # Without --output, a trailing .docx names the output; so does the
+    # second of exactly two arguments unless it is a .tex input
+    paths = list(args.files)
+    output_file = args.output
+    if output_file is None and len(paths) > 1:
+        last = paths[-1].lower()
+        if last.endswith('.docx') or (len(paths) == 2 and not last.endswith('.tex')):
+            output_file = paths.pop()
+
+    # Expand glob patterns (keep unmatched names for error reporting)
+    input_files = []
+    for path in paths:
+        input_files.extend(sorted(glob.glob(path)) or [path])
+
+    config = {}
+    if args.timeout is not None:
+        config['pandoc_timeout'] = args.timeout
+
+    # Check for bibliography config
+    bib_file = find_bibliography(input_files[0])
+    if bib_file:
+        config['bibliography'] = bib_file
+
+    if len(input_files) == 1:
+        return convert_to_docx(input_files[0], output_file, config)
+    return convert_many(input_files, output_file, config)
+
+
+def cmd_batch(args):
+    """Convert many files in parallel, one output per input."""
+    from .converter import convert_batch
+
+    # Directories contribute their .tex files; other arguments are globs
+    input_files = []
+    for path in args.inputs:
+        if os.path.isdir(path):
+            input_files.extend(sorted(glob.glob(os.path.join(path, '*.tex'))))
+        else:
+            input_files.extend(sorted(glob.glob(path)) or [path])
+
+    if not input_files:
+        print("✗ Error: No input files found")
+        return False
+
+    config = {}
+    if args.timeout is not None:
+        config['pandoc_timeout'] = args.timeout
+
+    # Each input uses the library.bib next to it, if any
+    configs = []
+    for input_file in input_files:
+        file_config = dict(config)
+        bib_file = find_bibliography(input_file)
+        if bib_file:
+            file_config['bibliography'] = bib_file
+        configs.append(file_config)
+
+    return convert_batch(input_files, args.output_dir, configs, args.workers)
+
+
+def cmd_format(args):
+    """Apply formatting to an existing Word document."""
+    from .formatter import apply_formatting
+
+    return apply_formatting(args.input, args.output)
+
+
+def build_parser():
+    """
+    Build the command-line parser.
+
+    Returns:
+        tuple: (parser, subparsers action holding one parser per command)
+    """
+    parser = _ArgumentParser(prog='paperkit', add_help=False)
+    subparsers = parser.add_subparsers(dest='cmd')
+
+    templates_parser = subparsers.add_parser(
+        'templates', help='List available journal templates')
+    templates_parser.set_defaults(func=cmd_templates)
+
+    init_parser = subparsers.add_parser(
+        'init', help='Initialize a new paper with proper formatting')
+    init_parser.add_argument('title', help='Paper title')
+    init_parser.add_argument('output', nargs='?', default='paper.docx',
+                             help='Output .docx file (default: paper.docx)')
+    init_parser.add_argument('--template', '-t', metavar='JOURNAL',
+                             help='Journal template (see: paperkit templates)')
+    init_parser.set_defaults(func=cmd_init)
+
+    convert_parser = subparsers.add_parser(
+        'convert', help='Convert LaTeX/Word to formatted Word document')
+    convert_parser.add_argument('files', nargs='+', metavar='FILE',
+                                help='Input .tex/.docx file(s) or glob pattern(s), '
+                                     'optionally followed by the output .docx')
+    convert_parser.add_argument('--output', '-o', metavar='FILE',
+                                help='Output .docx file')
+    convert_parser.add_argument('--timeout', type=int, metavar='SECONDS',
+                                help='Abort pandoc after this many seconds')
+    convert_parser.set_defaults(func=cmd_convert)
+
+    batch_parser = subparsers.add_parser(
+        'batch', help='Convert many files in parallel (one output per input)')
+    batch_parser.add_argument('inputs', nargs='+', metavar='DIR_OR_GLOB',
+                              help='Directory of .tex files, or file glob pattern(s)')
+    batch_parser.add_argument('--output-dir', '-o', metavar='DIR',
+                              help='Directory for outputs (default: next to inputs)')
+    batch_parser.add_argument('--workers', '-j', type=int, metavar='N',
+                              help='Number of parallel workers (default: CPU count)')
+    batch_parser.add_argument('--timeout', type=int, metavar='SECONDS',
+                              help='Abort each pandoc run after this many seconds')
+    batch_parser.set_defaults(func=cmd_batch)
+
+    format_parser = subparsers.add_parser(
+        'format', help='Apply formatting to existing Word document')
+    format_parser.add_argument('input', help='Input .docx file')
+    format_parser.add_argument('output', nargs='?',
+                               help='Output .docx file (default: overwrite input)')
+    format_parser.set_defaults(func=cmd_format)
+
+    return parser, subparsers
+
+
+def main(argv=None):
     """Main CLI entry point."""
 
-    if len(sys.argv) < 2:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if not argv:
         print_help()
         sys.exit(1)
 
-    command = sys.argv[1].lower()
+    command = argv[0].lower()
 
-    try:
-        if command == 'help' or command == '--help' or command == '-h':
-            print_help()
-            sys.exit(0)
-
-        elif command == 'templates':
-            print_templates()
-            sys.exit(0)
-
-        elif command == 'init':
-            if len(sys.argv) < 3:
-                print("✗ Error: Title required")
-                print('Usage: python -m paperkit init "Paper Title" [output.docx] [--template JOURNAL]')
-                sys.exit(1)
-
-            title = sys.argv[2]
-
-            # Parse arguments
-            output = "paper.docx"
-            template = None
-
-            i = 3
-            while i < len(sys.argv):
-                if sys.argv[i] == '--template' or sys.argv[i] == '-t':
-                    if i + 1 < len(sys.argv):
-                        template = sys.argv[i + 1]
-                        i += 2
-                    else:
-                        print("✗ Error: --template requires a value")
-                        sys.exit(1)
-                else:
-                    output = sys.argv[i]
-                    i += 1
-
-            success = init_paper(title, output, template=template)
-            sys.exit(0 if success else 1)
-
-        elif command == 'convert':
-            if len(sys.argv) < 3:
-                print("✗ Error: Input file required")
-                print("Usage: python -m paperkit convert input.tex [output.docx]")
-                sys.exit(1)
-
-            input_file = sys.argv[2]
-            output_file = sys.argv[3] if len(sys.argv) > 3 else None
-
-            # Check for bibliography config
-            config = {}
-            bib_file = Path(input_file).parent / "library.bib"
-            if bib_file.exists():
-                config['bibliography'] = str(bib_file)
-
-            success = convert_to_docx(input_file, output_file, config)
-            sys.exit(0 if success else 1)
-
-        elif command == 'format':
-            if len(sys.argv) < 3:
-                print("✗ Error: Input file required")
-                print("Usage: python -m paperkit format input.docx [output.docx]")
-                sys.exit(1)
-
-            input_file = sys.argv[2]
-            output_file = sys.argv[3] if len(sys.argv) > 3 else None
-
-            success = apply_formatting(input_file, output_file)
-            sys.exit(0 if success else 1)
+    if command in ('help', '--help', '-h'):
+        print_help()
+        sys.exit(0)
 
-        else:
-            print(f"✗ Error: Unknown command: {command}")
-            print("Run 'python -m paperkit help' for usage")
-            sys.exit(1)
+    parser, subparsers = build_parser()
+    subparser = subparsers.choices.get(command)
+    if subparser is None:
+        print(f"✗ Error: Unknown command: {command}")
+        print("Run 'python -m paperkit help' for usage")
+        sys.exit(1)
+
+    # Options may appear anywhere among the positional arguments
+    args = subparser.parse_intermixed_args(argv[1:])
+
+    try:
+        success = args.func(args)
+        sys.exit(0 if success else 1)
 
     except KeyboardInterrupt:
         print("\n\n⚠️  Interrupted by user")
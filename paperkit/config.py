@@ -2,6 +2,8 @@
 Configuration settings for academic papers
 """
 
+from functools import lru_cache
+
 # Paper size definitions (width, height in inches)
 PAPER_SIZES = {
     'a4': (8.27, 11.69),      # 210mm × 297mm
@@ -11,6 +13,25 @@ PAPER_SIZES = {
     'b5': (6.93, 9.84),       # 176mm × 250mm
 }
 
+
+@lru_cache(maxsize=None)
+def get_paper_size(name):
+    """
+    Get page dimensions for a paper size, as python-docx lengths.
+
+    Args:
+        name: Paper size key (e.g., 'a4', 'letter'); unknown names
+              fall back to A4
+
+    Returns:
+        tuple: (width, height) as docx.shared.Inches
+    """
+    from docx.shared import Inches
+
+    width, height = PAPER_SIZES.get(name, PAPER_SIZES['a4'])
+    return Inches(width), Inches(height)
+
+
 DEFAULT_CONFIG = {
     'font': 'Arial',
     'font_size': 12,
@@ -23,4 +44,7 @@ DEFAULT_CONFIG = {
     'language': 'en-GB',
     'csl_style': 'https://www.zotero.org/styles/apa',
     'paper_size': 'a4',  # Default to A4
+    'pandoc_timeout': 300,  # Seconds before a pandoc run is aborted
+    'pandoc_heap_mb': 512,  # Max pandoc heap size (Haskell RTS -M)
+    'zip_level': 1,  # .docx compression level (0 = stored, 1 = fastest)
 }
@@ -2,11 +2,110 @@
 Conversion module for LaTeX and Word documents
 """
 
+import hashlib
+import http.client
+import os
+import shutil
 import subprocess
+import tempfile
+import urllib.request
+import xml.etree.ElementTree as ElementTree
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from .formatter import apply_formatting
 from .config import DEFAULT_CONFIG
 
+# Root element of a CSL style file
+_CSL_STYLE_TAG = '{http://purl.org/net/xbiblio/csl}style'
+
+# Cached result of the pandoc availability check (None = not checked yet)
+_PANDOC_OK = None
+
+
+def _check_pandoc():
+    """
+    Check whether pandoc is available on PATH.
+
+    The lookup is done once per process and cached, so repeated
+    conversions do not pay for it again.
+
+    Returns:
+        True if pandoc was found, False otherwise
+    """
+    global _PANDOC_OK
+    if _PANDOC_OK is None:
+        _PANDOC_OK = shutil.which('pandoc') is not None
+    return _PANDOC_OK
+
+
+def _is_csl_style(data):
+    """Check that downloaded bytes are a CSL style (not e.g. an HTML page)."""
+    try:
+        return ElementTree.fromstring(data).tag == _CSL_STYLE_TAG
+    except ElementTree.ParseError:
+        return False
+
+
+@lru_cache(maxsize=None)
+def _resolve_csl(csl_style):
+    """
+    Return a local path for a CSL style, downloading it once if needed.
+
+    Pandoc fetches a URL style on every run, so remote styles are saved
+    to the user cache directory (``$XDG_CACHE_HOME/paperkit/csl``) and
+    reused by later conversions. Files are named after a hash of the
+    full URL and written atomically, so parallel workers never see a
+    partial download. Only responses that parse as a CSL <style> are
+    cached. If the download fails or is not a CSL style, the original
+    value is returned and pandoc fetches it itself.
+
+    Cached styles are never refreshed automatically; delete the file (or
+    the whole ``paperkit/csl`` cache folder) to download them again.
+
+    Args:
+        csl_style: CSL style path or URL
+
+    Returns:
+        str: Local path to the style, or csl_style unchanged
+    """
+    if not csl_style.startswith(('http://', 'https://')):
+        return csl_style
+
+    cache_home = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    cache_dir = Path(cache_home) / 'paperkit' / 'csl'
+    name = csl_style.rstrip('/').rsplit('/', 1)[-1]
+    if name.endswith('.csl'):
+        name = name[:-4]
+    digest = hashlib.sha256(csl_style.encode('utf-8')).hexdigest()[:16]
+    csl_file = cache_dir / f'{name}-{digest}.csl'
+
+    if csl_file.exists():
+        return str(csl_file)
+
+    try:
+        with urllib.request.urlopen(csl_style, timeout=30) as response:
+            data = response.read()
+    except (OSError, http.client.HTTPException, ValueError):
+        return csl_style
+
+    if not _is_csl_style(data):
+        return csl_style
+
+    temp_name = None
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(temp_name, csl_file)
+    except OSError:
+        if temp_name is not None and os.path.exists(temp_name):
+            os.unlink(temp_name)
+        return csl_style
+
+    return str(csl_file)
+
 
 def convert_to_docx(input_file, output_file=None, config=None):
     """
@@ -39,7 +138,7 @@ def convert_to_docx(input_file, output_file=None, config=None):
     suffix = input_path.suffix.lower()
 
     if suffix == '.tex':
-        return _convert_tex_to_docx(input_file, output_file, cfg)
+        return _convert_tex_to_docx([input_file], output_file, cfg)
     elif suffix == '.docx':
         return _convert_docx_to_docx(input_file, output_file, cfg)
     else:
@@ -48,25 +147,146 @@ def convert_to_docx(input_file, output_file=None, config=None):
         return False
 
 
-def _convert_tex_to_docx(tex_file, output_file, config):
+def convert_many(input_files, output_file=None, config=None):
+    """
+    Convert several LaTeX files into a single formatted Word document.
+
+    All inputs are passed to one pandoc invocation, so pandoc's startup
+    and citation processor initialisation are paid once rather than per
+    file. Inputs are concatenated in the order given.
+
+    Args:
+        input_files: List of paths to input .tex files
+        output_file: Path to output .docx file (default: first input
+                     with a .docx suffix)
+        config: Optional configuration dict
+
+    Returns:
+        True if successful, False otherwise
+    """
+
+    cfg = DEFAULT_CONFIG.copy()
+    if config:
+        cfg.update(config)
+
+    if not input_files:
+        print("✗ Error: No input files given")
+        return False
+
+    for input_file in input_files:
+        input_path = Path(input_file)
+
+        if not input_path.exists():
+            print(f"✗ Error: File not found: {input_file}")
+            return False
+
+        if input_path.suffix.lower() != '.tex':
+            print(f"✗ Error: Unsupported file type: {input_path.suffix.lower()}")
+            print(f"   Supported for multiple inputs: .tex")
+            return False
+
+    return _convert_tex_to_docx(list(input_files), output_file, cfg)
+
+
+def convert_batch(input_files, output_dir=None, config=None, workers=None):
+    """
+    Convert many independent files in parallel, one output per input.
+
+    Each input is converted with convert_to_docx() in a separate worker
+    process, so pandoc runs and formatting passes use all CPU cores.
+
+    Args:
+        input_files: List of paths to input files (.tex or .docx)
+        output_dir: Directory for the .docx outputs (default: next to
+                    each input)
+        config: Optional configuration dict shared by all inputs, or a
+                list with one configuration dict per input
+        workers: Number of worker processes (default: CPU count)
+
+    Returns:
+        True if every file was converted, False otherwise
+    """
+
+    if not input_files:
+        print("✗ Error: No input files given")
+        return False
+
+    if workers is not None and (not isinstance(workers, int) or workers < 1):
+        print(f"✗ Error: workers must be a positive integer, got {workers!r}")
+        return False
+
+    if isinstance(config, (list, tuple)):
+        configs = list(config)
+        if len(configs) != len(input_files):
+            print("✗ Error: Expected one config per input file")
+            return False
+    else:
+        configs = [config] * len(input_files)
+
+    output_files = []
+    for input_file in input_files:
+        if output_dir is None:
+            output_files.append(None)
+        else:
+            name = os.path.splitext(os.path.basename(input_file))[0] + '.docx'
+            output_files.append(os.path.join(output_dir, name))
+
+    # Workers must not share an output (or its pandoc temp file)
+    targets = {}
+    for input_file, output_file in zip(input_files, output_files):
+        target = output_file or os.path.splitext(input_file)[0] + '.docx'
+        key = os.path.normcase(os.path.abspath(target))
+        if key in targets:
+            print(f"✗ Error: {targets[key]} and {input_file} would both "
+                  f"be written to {target}")
+            return False
+        targets[key] = input_file
+
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+
+    failed = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(convert_to_docx, input_file, output_file, file_config)
+            for input_file, output_file, file_config
+            in zip(input_files, output_files, configs)
+        ]
+        for input_file, future in zip(input_files, futures):
+            try:
+                success = future.result()
+            except Exception as e:
+                print(f"✗ Conversion failed for {input_file}: {e}")
+                success = False
+            if not success:
+                failed.append(input_file)
+
+    print()
+    print("=" * 60)
+    print(f"Batch conversion: {len(input_files) - len(failed)}/{len(input_files)} succeeded")
+    print("=" * 60)
+    for input_file in failed:
+        print(f"✗ Failed: {input_file}")
+
+    return not failed
+
+
+def _convert_tex_to_docx(tex_files, output_file, config):
     """Convert LaTeX to formatted Word document (two-step process)."""
 
     if output_file is None:
-        output_file = Path(tex_file).with_suffix('.docx')
+        output_file = Path(tex_files[0]).with_suffix('.docx')
 
     print()
     print("=" * 60)
     print("LaTeX to Word Conversion")
     print("=" * 60)
-    print(f"Input:  {tex_file}")
+    print(f"Input:  {', '.join(str(f) for f in tex_files)}")
     print(f"Output: {output_file}")
     print()
 
     # Check if pandoc is installed
-    try:
-        subprocess.run(['pandoc', '--version'],
-                      capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    if not _check_pandoc():
         print("✗ Error: Pandoc not found")
         print("   Install with: brew install pandoc")
         return False
@@ -74,30 +294,37 @@ def _convert_tex_to_docx(tex_file, output_file, config):
     # Step 1: Convert with pandoc
     print("Step 1/2: Converting LaTeX to Word with pandoc...")
 
-    temp_file = Path(output_file).parent / f".temp_{Path(output_file).name}"
+    output_dir, output_name = os.path.split(str(output_file))
+    temp_file = os.path.join(output_dir, f".temp_{output_name}")
 
-    pandoc_cmd = [
-        'pandoc',
-        str(tex_file),
+    pandoc_cmd = ['pandoc']
+    pandoc_cmd.extend(str(f) for f in tex_files)
+    pandoc_cmd.extend([
         '-s',
-        '-o', str(temp_file)
-    ]
+        '-o', temp_file
+    ])
 
     # Add bibliography if specified in config
     if 'bibliography' in config and config['bibliography']:
         pandoc_cmd.extend(['--bibliography', config['bibliography']])
         pandoc_cmd.extend(['--citeproc'])
-        pandoc_cmd.extend(['--csl', config['csl_style']])
+        pandoc_cmd.extend(['--csl', _resolve_csl(config['csl_style'])])
+
+    # Bound pandoc's run time and memory use
+    timeout = config['pandoc_timeout']
+    heap_mb = config['pandoc_heap_mb']
+    if heap_mb:
+        pandoc_cmd.extend(['+RTS', f'-M{heap_mb}M', '-RTS'])
 
     try:
         result = subprocess.run(
             pandoc_cmd,
             capture_output=True,
             text=True,
-            timeout=300
+            timeout=timeout
         )
 
-        if not temp_file.exists():
+        if not os.path.exists(temp_file):
             print(f"✗ Pandoc conversion failed")
             if result.stderr:
                 print(f"   {result.stderr}")
@@ -106,7 +333,7 @@ def _convert_tex_to_docx(tex_file, output_file, config):
         print(f"✓ Raw conversion complete")
 
     except subprocess.TimeoutExpired:
-        print("✗ Conversion timed out (5 minutes)")
+        print(f"✗ Conversion timed out ({timeout} seconds)")
         return False
     except Exception as e:
         print(f"✗ Conversion failed: {e}")
@@ -116,11 +343,11 @@ def _convert_tex_to_docx(tex_file, output_file, config):
     print()
     print("Step 2/2: Applying formatting...")
 
-    success = apply_formatting(str(temp_file), str(output_file), config)
+    success = apply_formatting(temp_file, str(output_file), config)
 
     # Clean up temp file
-    if temp_file.exists():
-        temp_file.unlink()
+    if os.path.exists(temp_file):
+        os.remove(temp_file)
 
     return success
 
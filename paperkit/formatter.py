@@ -2,12 +2,351 @@
 Formatting module for Word documents
 """
 
+import zipfile
+from contextlib import contextmanager
+from copy import deepcopy
+from functools import lru_cache
+from io import BytesIO
 from docx import Document
-from docx.shared import Pt, Inches, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
-from .config import DEFAULT_CONFIG, PAPER_SIZES
+from docx.shared import Emu, Length, Pt, Inches, Twips
+from docx.enum.style import WD_STYLE_TYPE
+from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
+from docx.oxml.ns import qn, nsdecls
+from docx.oxml import OxmlElement, parse_xml
+from docx.opc.pkgwriter import PackageWriter
+from docx.text.paragraph import Paragraph
+from lxml import etree
+from .config import DEFAULT_CONFIG, get_paper_size
+
+# Border edges, in the order Word writes them
+_BORDER_EDGES = ('top', 'left', 'bottom', 'right', 'insideH', 'insideV')
+
+# Qualified tag/attribute names used by the XML helpers, resolved once
+_QN = {
+    name: qn(f'w:{name}')
+    for name in ('p', 'tblBorders', 'tcBorders', 'rFonts', 'asciiTheme',
+                 'hAnsiTheme', 'sz', 'val', 'color')
+}
+
+
+def _make_no_border_edges():
+    """Build one 'no border' element per table edge, used as templates."""
+    edges = []
+    for edge in _BORDER_EDGES:
+        edge_element = OxmlElement(f'w:{edge}')
+        edge_element.set(_QN['sz'], '0')
+        edge_element.set(_QN['val'], 'none')
+        edge_element.set(_QN['color'], 'auto')
+        edges.append(edge_element)
+    return tuple(edges)
+
+
+_NO_BORDER_EDGES = _make_no_border_edges()
+
+# APA cell borders (w:tcBorders) for each row category: 1/2 pt black line
+# above and below the header row, below the last row, nothing elsewhere
+_APA_LINE = 'w:sz="6" w:val="single" w:color="000000"'
+_APA_NONE = 'w:sz="0" w:val="none"'
+
+_TCBORDERS_FIRST = (
+    f'<w:tcBorders {nsdecls("w")}>'
+    f'<w:top {_APA_LINE}/><w:bottom {_APA_LINE}/>'
+    f'<w:left {_APA_NONE}/><w:right {_APA_NONE}/>'
+    f'<w:insideH {_APA_NONE}/><w:insideV {_APA_NONE}/>'
+    '</w:tcBorders>'
+)
+_TCBORDERS_LAST = (
+    f'<w:tcBorders {nsdecls("w")}>'
+    f'<w:top {_APA_NONE}/><w:bottom {_APA_LINE}/>'
+    f'<w:left {_APA_NONE}/><w:right {_APA_NONE}/>'
+    f'<w:insideH {_APA_NONE}/><w:insideV {_APA_NONE}/>'
+    '</w:tcBorders>'
+)
+_TCBORDERS_MIDDLE = (
+    f'<w:tcBorders {nsdecls("w")}>'
+    f'<w:top {_APA_NONE}/><w:bottom {_APA_NONE}/>'
+    f'<w:left {_APA_NONE}/><w:right {_APA_NONE}/>'
+    f'<w:insideH {_APA_NONE}/><w:insideV {_APA_NONE}/>'
+    '</w:tcBorders>'
+)
+
+# Parsed once; each cell gets a deep copy
+_TCBORDERS_TEMPLATES = {
+    'first': parse_xml(_TCBORDERS_FIRST),
+    'last': parse_xml(_TCBORDERS_LAST),
+    'middle': parse_xml(_TCBORDERS_MIDDLE),
+}
+
+# Fixed paragraph spacing (before, after); Lengths are immutable ints
+_BODY_SPACING = (Pt(0), Pt(6))
+_CAPTION_SPACING = (Pt(12), Pt(0))
+
+
+@lru_cache(maxsize=2)
+def _load_template_bytes(template_file=None):
+    """
+    Read a .docx package into memory, once per process.
+
+    Args:
+        template_file: Path to a .docx template (None for the
+                       python-docx built-in default template)
+
+    Returns:
+        bytes: Raw contents of the package
+    """
+    if template_file is None:
+        try:
+            from docx.api import _default_docx_path
+        except ImportError:
+            # Private helper gone in this python-docx; serialize the default
+            buffer = BytesIO()
+            Document().save(buffer)
+            return buffer.getvalue()
+        template_file = _default_docx_path()
+
+    with open(template_file, 'rb') as f:
+        return f.read()
+
+
+def new_document(template_file=None):
+    """
+    Create a new document from a cached template package.
+
+    Equivalent to ``Document(template_file)``, but the template is only
+    read from disk on first use.
+
+    Args:
+        template_file: Path to a .docx template (None for the default)
+
+    Returns:
+        python-docx Document object
+    """
+    return Document(BytesIO(_load_template_bytes(template_file)))
+
+
+def release_models():
+    """Drop cached document and formatting templates held by the formatter."""
+    _load_template_bytes.cache_clear()
+    _rpr_templates.cache_clear()
+
+
+# Nesting depth of session() blocks
+_session_depth = 0
+
+
+@contextmanager
+def session():
+    """
+    Context manager that releases cached templates when a batch is done.
+
+    Templates are cached per process whether or not a session is used;
+    the session only calls release_models() when its block exits, so
+    the memory is given back after a batch. Nested sessions release
+    nothing until the outermost one exits.
+
+    Example:
+        with paperkit.session():
+            for path in drafts:
+                paperkit.apply_formatting(path)
+    """
+    global _session_depth
+    _session_depth += 1
+    try:
+        yield
+    finally:
+        _session_depth -= 1
+        if _session_depth == 0:
+            release_models()
+
+
+# save_document() drives these private PackageWriter steps itself; without
+# them it falls back to doc.save() and the default zip settings
+_PKG_WRITER_STEPS = ('_write_content_types_stream', '_write_pkg_rels',
+                     '_write_parts')
+_CAN_CUSTOMIZE_SAVE = all(hasattr(PackageWriter, name)
+                          for name in _PKG_WRITER_STEPS)
+
+
+class _ZipPkgWriter:
+    """
+    Physical package writer with configurable compression.
+
+    Implements the write()/close() interface python-docx's PackageWriter
+    expects.
+    """
+
+    def __init__(self, pkg_file, compresslevel=None):
+        if compresslevel == 0:
+            compression = zipfile.ZIP_STORED
+            compresslevel = None
+        else:
+            compression = zipfile.ZIP_DEFLATED
+        self._zipf = zipfile.ZipFile(pkg_file, 'w', compression,
+                                     allowZip64=True,
+                                     compresslevel=compresslevel)
+
+    def write(self, pack_uri, blob):
+        """Add one part to the archive."""
+        self._zipf.writestr(pack_uri.membername, blob)
+
+    def close(self):
+        self._zipf.close()
+
+
+def save_document(doc, output_file, cfg):
+    """
+    Save a document, honouring the save options in the configuration.
+
+    The options need python-docx's PackageWriter internals; if this
+    python-docx lacks them, the document is saved with doc.save().
+
+    Options:
+        zip_level: zlib compression level 1-9 (0 stores parts
+                   uncompressed, None uses the zlib default)
+
+    Args:
+        doc: python-docx Document object
+        output_file: Path to output .docx file
+        cfg: Configuration dictionary
+
+    Raises:
+        ValueError: If zip_level is not None or an integer from 0 to 9
+    """
+    # Checked up front: a bad level would only fail inside the archive
+    # writer, leaving a partial file behind
+    zip_level = cfg.get('zip_level')
+    if zip_level is not None and (not isinstance(zip_level, int)
+                                  or not 0 <= zip_level <= 9):
+        raise ValueError(f"zip_level must be None or 0-9, got {zip_level!r}")
+
+    if not _CAN_CUSTOMIZE_SAVE:
+        doc.save(output_file)
+        return
+
+    package = doc.part.package
+    parts = list(package.parts)
+    for part in parts:
+        part.before_marshal()
+
+    writer = _ZipPkgWriter(output_file, compresslevel=zip_level)
+    try:
+        PackageWriter._write_content_types_stream(writer, parts)
+        PackageWriter._write_pkg_rels(writer, package.rels)
+        PackageWriter._write_parts(writer, parts)
+    finally:
+        writer.close()
+
+
+def _build_rpr_template(font, size, bold=False, italic=False):
+    """
+    Build a w:rPr element holding the target run formatting.
+
+    Args:
+        font: Font name
+        size: Font size in points
+        bold: Whether the run should be bold
+        italic: Whether the run should be italic
+
+    Returns:
+        w:rPr element to be merged into runs with _apply_rpr_template()
+    """
+    rPr = OxmlElement('w:rPr')
+
+    rFonts = OxmlElement('w:rFonts')
+    rFonts.set(qn('w:ascii'), font)
+    rFonts.set(qn('w:hAnsi'), font)
+    rPr.append(rFonts)
+
+    if bold:
+        rPr.append(OxmlElement('w:b'))
+    if italic:
+        rPr.append(OxmlElement('w:i'))
+
+    color = OxmlElement('w:color')
+    color.set(qn('w:val'), '000000')  # Explicit black
+    rPr.append(color)
+
+    sz = OxmlElement('w:sz')
+    sz.set(qn('w:val'), str(round(size * 2)))  # Half-points
+    rPr.append(sz)
+
+    return rPr
+
+
+@lru_cache(maxsize=16)
+def _rpr_templates(font, font_size, title_size,
+                   heading1_size, heading2_size, heading3_size):
+    """
+    Build the run templates apply_formatting() needs for one configuration.
+
+    Cached, so repeated calls with the same settings reuse the templates.
+    Templates are only ever copied from, never modified.
+
+    Returns:
+        tuple: (body, title, heading 1, heading 2, heading 3) w:rPr elements
+    """
+    return (
+        _build_rpr_template(font, font_size),
+        _build_rpr_template(font, title_size, bold=True),
+        _build_rpr_template(font, heading1_size, bold=True),
+        _build_rpr_template(font, heading2_size, bold=True),
+        _build_rpr_template(font, heading3_size, bold=True),
+    )
+
+
+def _apply_rpr_template(run_element, template):
+    """
+    Merge a run property template into a run, keeping other properties.
+
+    Each property in the template replaces the run's own (or is inserted
+    in schema order if missing). Font names are merged so other font
+    slots on the run (e.g. East Asian) are kept; Latin theme fonts are
+    dropped since Word would prefer them over the explicit name.
+    Properties that already match are left untouched, so reformatting a
+    formatted document writes nothing.
+
+    Also works on styles, whose run properties use the same w:rPr.
+
+    Args:
+        run_element: w:r (or w:style) element
+        template: w:rPr element from _build_rpr_template()
+    """
+    rPr = run_element.get_or_add_rPr()
+    for prop in template:
+        existing = rPr.find(prop.tag)
+        if existing is None:
+            insert = getattr(rPr, f'_insert_{etree.QName(prop).localname}')
+            insert(deepcopy(prop))
+        elif prop.tag == _QN['rFonts']:
+            for key, value in prop.items():
+                if existing.get(key) != value:
+                    existing.set(key, value)
+            for key in (_QN['asciiTheme'], _QN['hAnsiTheme']):
+                if key in existing.attrib:
+                    del existing.attrib[key]
+        elif existing.items() != prop.items():
+            rPr.replace(existing, deepcopy(prop))
+
+
+def format_styles(doc, cfg):
+    """
+    Set fonts on the Normal, Title and Heading 1-3 styles.
+
+    Paragraphs in these styles then need no per-run font formatting;
+    runs only carry properties that override their style.
+
+    Args:
+        doc: python-docx Document object
+        cfg: Configuration dictionary
+    """
+    body_rpr, title_rpr, h1_rpr, h2_rpr, h3_rpr = _rpr_templates(
+        cfg['font'], cfg['font_size'], cfg['title_size'],
+        cfg['heading1_size'], cfg['heading2_size'], cfg['heading3_size'])
+
+    for style_name, rpr in (('Normal', body_rpr), ('Title', title_rpr),
+                            ('Heading 1', h1_rpr), ('Heading 2', h2_rpr),
+                            ('Heading 3', h3_rpr)):
+        _apply_rpr_template(doc.styles[style_name].element, rpr)
 
 
 def clear_table_borders(table):
@@ -24,7 +363,7 @@ def clear_table_borders(table):
         tbl.insert(0, tblPr)
 
     # Remove table borders element if it exists
-    tblBorders = tblPr.find(qn('w:tblBorders'))
+    tblBorders = tblPr.find(_QN['tblBorders'])
     if tblBorders is not None:
         tblPr.remove(tblBorders)
 
@@ -33,12 +372,8 @@ def clear_table_borders(table):
     tblPr.append(tblBorders)
 
     # Set all table-level borders to none
-    no_border = {'sz': '0', 'val': 'none', 'color': 'auto'}
-    for edge in ['top', 'left', 'bottom', 'right', 'insideH', 'insideV']:
-        edge_element = OxmlElement(f'w:{edge}')
-        for key, value in no_border.items():
-            edge_element.set(qn(f'w:{key}'), value)
-        tblBorders.append(edge_element)
+    for edge_element in _NO_BORDER_EDGES:
+        tblBorders.append(deepcopy(edge_element))
 
 
 def set_cell_border(cell, **kwargs):
@@ -54,7 +389,7 @@ def set_cell_border(cell, **kwargs):
     tcPr = tc.get_or_add_tcPr()
 
     # Get or create table cell borders element
-    tcBorders = tcPr.find(qn('w:tcBorders'))
+    tcBorders = tcPr.find(_QN['tcBorders'])
     if tcBorders is None:
         tcBorders = OxmlElement('w:tcBorders')
         tcPr.append(tcBorders)
@@ -88,49 +423,46 @@ def apply_apa_table_style(table, cfg):
     # First, clear all table-level borders
     clear_table_borders(table)
 
-    # APA border style: single line, black, 1/2 pt width
-    border_style = {'sz': 6, 'val': 'single', 'color': '000000'}
-    no_border = {'sz': 0, 'val': 'none'}
-
-    num_rows = len(table.rows)
-
-    for row_idx, row in enumerate(table.rows):
+    # Run properties for header and body cells; runs that already match
+    # are left untouched
+    header_rpr = _build_rpr_template(cfg['font'], cfg['font_size'], bold=True)
+    cell_rpr = _build_rpr_template(cfg['font'], cfg['font_size'])
+    left = WD_ALIGN_PARAGRAPH.LEFT
+    # Rows, cells, paragraphs and runs are walked as lxml elements, without
+    # python-docx wrappers; each w:tc is visited once, merged or not
+    tr_lst = table._tbl.tr_lst
+    num_rows = len(tr_lst)
+
+    for row_idx, tr in enumerate(tr_lst):
         is_first_row = (row_idx == 0)
         is_last_row = (row_idx == num_rows - 1)
 
-        for cell in row.cells:
-            # Format cell text
-            for paragraph in cell.paragraphs:
-                # Left align
-                paragraph.alignment = WD_ALIGN_PARAGRAPH.LEFT
-
-                for run in paragraph.runs:
-                    run.font.name = cfg['font']
-                    run.font.size = Pt(cfg['font_size'])
-                    run.font.color.rgb = RGBColor(0, 0, 0)
-
-                    # Bold header row
-                    if is_first_row:
-                        run.font.bold = True
-
-            # First, clear ALL borders for this cell
-            set_cell_border(cell,
-                top=no_border,
-                bottom=no_border,
-                left=no_border,
-                right=no_border,
-                insideH=no_border,
-                insideV=no_border
-            )
-
-            # Then apply only the APA 3-line borders
-            # Top border: Line 1 (only on first row)
-            if is_first_row:
-                set_cell_border(cell, top=border_style)
-
-            # Bottom border: Line 2 (bottom of header) and Line 3 (bottom of table)
-            if is_first_row or is_last_row:
-                set_cell_border(cell, bottom=border_style)
+        # APA 3-line borders for this row: Line 1 and Line 2 around the
+        # header row, Line 3 under the last row, no other lines
+        if is_first_row:
+            borders = _TCBORDERS_TEMPLATES['first']
+        elif is_last_row:
+            borders = _TCBORDERS_TEMPLATES['last']
+        else:
+            borders = _TCBORDERS_TEMPLATES['middle']
+
+        # Font, size and colour; bold in the header row
+        rpr = header_rpr if is_first_row else cell_rpr
+
+        for tc in tr.tc_lst:
+            # Format cell text: left align, then the run template
+            for p in tc.iterchildren(_QN['p']):
+                p.alignment = left
+                for run_element in p.r_lst:
+                    _apply_rpr_template(run_element, rpr)
+
+            # Replace the cell borders in one go
+            tcPr = tc.get_or_add_tcPr()
+            old_borders = tcPr.find(_QN['tcBorders'])
+            if old_borders is not None:
+                tcPr.replace(old_borders, deepcopy(borders))
+            else:
+                tcPr.append(deepcopy(borders))
 
 
 def format_table_caption(paragraph, table_number, cfg):
@@ -150,47 +482,87 @@ def format_table_caption(paragraph, table_number, cfg):
     """
     text = paragraph.text.strip()
 
+    # Run properties for the new runs (fresh elements, inserted as-is)
+    label_rpr = _build_rpr_template(cfg['font'], cfg['font_size'],
+                                    bold=True, italic=True)
+    title_rpr = _build_rpr_template(cfg['font'], cfg['font_size'], italic=True)
+
     # Clear existing runs
     for run in paragraph.runs:
         run._element.getparent().remove(run._element)
 
     # Check if text already starts with "Table X"
     if not text.lower().startswith('table'):
-        # Add "Table X" prefix
+        # Add "Table X" prefix in bold italics
         table_label = paragraph.add_run(f"Table {table_number}")
-        table_label.font.bold = True
-        table_label.font.italic = True
-        table_label.font.name = cfg['font']
-        table_label.font.size = Pt(cfg['font_size'])
-        table_label.font.color.rgb = RGBColor(0, 0, 0)  # Black text
+        table_label._element.insert(0, label_rpr)
 
         # Add line break
         paragraph.add_run("\n")
 
-        # Add title text
-        title_run = paragraph.add_run(text)
-        title_run.font.italic = True
-        title_run.font.name = cfg['font']
-        title_run.font.size = Pt(cfg['font_size'])
-        title_run.font.color.rgb = RGBColor(0, 0, 0)  # Black text
-    else:
-        # Text already has "Table X", just format it
-        title_run = paragraph.add_run(text)
-        title_run.font.italic = True
-        title_run.font.name = cfg['font']
-        title_run.font.size = Pt(cfg['font_size'])
-        title_run.font.color.rgb = RGBColor(0, 0, 0)  # Black text
+    # Add title text (or the existing "Table X" text) in italics
+    title_run = paragraph.add_run(text)
+    title_run._element.insert(0, title_rpr)
 
     # Left align
     paragraph.alignment = WD_ALIGN_PARAGRAPH.LEFT
-    paragraph.paragraph_format.space_before = Pt(12)
-    paragraph.paragraph_format.space_after = Pt(0)
+    paragraph_format = paragraph.paragraph_format
+    paragraph_format.space_before, paragraph_format.space_after = _CAPTION_SPACING
+
+
+def _styles_shared_outside_body(doc):
+    """
+    Find paragraph styles that content outside the body paragraphs uses.
+
+    That is every paragraph that is not a direct child of the body
+    (tables, content controls such as a TOC, text boxes) and every
+    paragraph in other parts (headers, footers, footnotes, comments),
+    together with the styles those paragraphs' styles are based on.
+    apply_formatting() leaves these styles alone, since changing them
+    would also restyle that content.
+
+    Args:
+        doc: python-docx Document object
+
+    Returns:
+        set: Style ids
+    """
+    body = doc.element.body
+    styles = doc.styles.element
+    default_style = styles.default_for(WD_STYLE_TYPE.PARAGRAPH)
+    default_id = default_style.styleId if default_style is not None else None
+
+    used = set()
+    for part in doc.part.package.iter_parts():
+        element = getattr(part, 'element', None)
+        if element is None:
+            continue
+        for p in element.iter(_QN['p']):
+            if p.getparent() is body:
+                continue
+            used.add(p.style or default_id)
+
+    # Styles are inherited through their basedOn chain
+    shared = set()
+    for style_id in used:
+        while style_id is not None and style_id not in shared:
+            shared.add(style_id)
+            style = styles.get_by_id(style_id)
+            style_id = style.basedOn_val if style is not None else None
+    return shared
 
 
 def apply_formatting(input_file, output_file=None, config=None):
     """
     Apply formatting to an existing Word document.
 
+    Body paragraphs get the configured font, size and spacing; headings
+    and the title are formatted on their runs. Body formatting is written
+    into a paragraph style when no content outside the body paragraphs
+    (headers, footers, footnotes, tables, TOC) uses or inherits that
+    style, and onto the paragraph's runs otherwise, so such content keeps
+    its look.
+
     Args:
         input_file: Path to input .docx file
         output_file: Path to output .docx file (if None, overwrites input)
@@ -213,77 +585,106 @@ def apply_formatting(input_file, output_file=None, config=None):
     # Set page size and margins
     paper_size = cfg.get('paper_size', 'a4')
     print(f"Setting page size to {paper_size.upper()} and margins to {cfg['margins']} inch...")
+    margin = Inches(cfg['margins'])
     for section in doc.sections:
-        # Get paper size from config
-        if paper_size in PAPER_SIZES:
-            width, height = PAPER_SIZES[paper_size]
-            section.page_width = Inches(width)
-            section.page_height = Inches(height)
-        else:
-            # Default to A4 if invalid
-            section.page_width = Inches(8.27)
-            section.page_height = Inches(11.69)
+        # Get paper size from config (defaults to A4 if invalid)
+        section.page_width, section.page_height = get_paper_size(paper_size)
 
         # Set margins
-        margin = Inches(cfg['margins'])
         section.top_margin = margin
         section.bottom_margin = margin
         section.left_margin = margin
         section.right_margin = margin
 
     # Apply formatting to all paragraphs
-    print(f"Applying font: {cfg['font']}, {cfg['font_size']}pt...")
-    print(f"Setting line spacing: {cfg['line_spacing']}...")
+    print(f"Applying font: {cfg['font']}, {cfg['font_size']}pt...\n"
+          f"Setting line spacing: {cfg['line_spacing']}...")
+
+    # Target run formatting for each paragraph class (cached per config)
+    body_rpr, title_rpr, h1_rpr, h2_rpr, h3_rpr = _rpr_templates(
+        cfg['font'], cfg['font_size'], cfg['title_size'],
+        cfg['heading1_size'], cfg['heading2_size'], cfg['heading3_size'])
+
+    # Style name prefix -> run formatting ('Title' matches anywhere in the name)
+    heading_rpr = {
+        'Heading 1': h1_rpr,
+        'Heading 2': h2_rpr,
+        'Heading 3': h3_rpr,
+    }
+    rpr_by_style_id = {}
+
+    # Body formatting for paragraphs whose style is shared with content
+    # outside the body paragraphs: written on the runs, not the style.
+    # A distinct object, so the run loop can tell it from body_rpr.
+    shared_body_rpr = deepcopy(body_rpr)
+    shared_styles = None
+
+    # Spacing and alignment values, as ParagraphFormat would write them.
+    # Line spacing: a number is a multiple of single spacing, a Length an
+    # exact height (an existing "at least" rule is kept), None clears it.
+    line_value = cfg['line_spacing']
+    keep_at_least = isinstance(line_value, Length)
+    if line_value is None:
+        line_spacing, line_rule = None, None
+    elif keep_at_least:
+        line_spacing, line_rule = line_value, WD_LINE_SPACING.EXACTLY
+    else:
+        line_spacing = Emu(line_value * Twips(240))
+        line_rule = WD_LINE_SPACING.MULTIPLE
+    space_before, space_after = _BODY_SPACING
+    left = WD_ALIGN_PARAGRAPH.LEFT
 
+    # Body paragraphs are handled as w:p elements directly, without
+    # Paragraph/Run wrappers (same paragraphs as doc.paragraphs)
     paragraph_count = 0
-    for paragraph in doc.paragraphs:
+    for p in doc.element.body.iterchildren(_QN['p']):
         paragraph_count += 1
 
-        # Apply font to all runs
-        for run in paragraph.runs:
-            run.font.name = cfg['font']
-            run.font.size = Pt(cfg['font_size'])
-            run.font.color.rgb = RGBColor(0, 0, 0)  # Explicit black
-
-        # Apply heading styles
-        style_name = paragraph.style.name
-
-        if style_name == 'Title' or 'Title' in style_name:
-            for run in paragraph.runs:
-                run.font.size = Pt(cfg['title_size'])
-                run.font.bold = True
-                run.font.name = cfg['font']
-                run.font.color.rgb = RGBColor(0, 0, 0)
-            paragraph.alignment = WD_ALIGN_PARAGRAPH.LEFT
-
-        elif style_name.startswith('Heading 1'):
-            for run in paragraph.runs:
-                run.font.size = Pt(cfg['heading1_size'])
-                run.font.bold = True
-                run.font.name = cfg['font']
-                run.font.color.rgb = RGBColor(0, 0, 0)
-            paragraph.alignment = WD_ALIGN_PARAGRAPH.LEFT
-
-        elif style_name.startswith('Heading 2'):
-            for run in paragraph.runs:
-                run.font.size = Pt(cfg['heading2_size'])
-                run.font.bold = True
-                run.font.name = cfg['font']
-                run.font.color.rgb = RGBColor(0, 0, 0)
-            paragraph.alignment = WD_ALIGN_PARAGRAPH.LEFT
-
-        elif style_name.startswith('Heading 3'):
-            for run in paragraph.runs:
-                run.font.size = Pt(cfg['heading3_size'])
-                run.font.bold = True
-                run.font.name = cfg['font']
-                run.font.color.rgb = RGBColor(0, 0, 0)
-            paragraph.alignment = WD_ALIGN_PARAGRAPH.LEFT
-
         # Set line spacing
-        paragraph.paragraph_format.line_spacing = cfg['line_spacing']
-        paragraph.paragraph_format.space_before = Pt(0)
-        paragraph.paragraph_format.space_after = Pt(6)
+        pPr = p.get_or_add_pPr()
+        pPr.spacing_line = line_spacing
+        if not (keep_at_least and
+                pPr.spacing_lineRule == WD_LINE_SPACING.AT_LEAST):
+            pPr.spacing_lineRule = line_rule
+        pPr.spacing_before = space_before
+        pPr.spacing_after = space_after
+
+        # Nothing else to do for empty (spacing) paragraphs
+        run_elements = p.r_lst
+        if not run_elements:
+            continue
+
+        # Pick heading or body formatting, resolving each style only once.
+        # Body formatting goes into the paragraph style itself, so it is
+        # written once per style rather than once per run. Title and
+        # heading formatting stays on the runs: in the style, its bold
+        # would be inherited by every style based on it.
+        style_id = p.style
+        rpr = rpr_by_style_id.get(style_id)
+        if rpr is None:
+            style = doc.part.get_style(style_id, WD_STYLE_TYPE.PARAGRAPH)
+            style_name = style.name
+            if 'Title' in style_name:
+                rpr = title_rpr
+            else:
+                rpr = heading_rpr.get(style_name[:9], body_rpr)
+            if rpr is body_rpr:
+                if shared_styles is None:
+                    shared_styles = _styles_shared_outside_body(doc)
+                if style.style_id in shared_styles:
+                    rpr = shared_body_rpr
+                else:
+                    _apply_rpr_template(style.element, rpr)
+            rpr_by_style_id[style_id] = rpr
+
+        # Body runs with direct formatting may override their (formatted)
+        # style; the rest inherit it. All other runs are formatted.
+        for run_element in run_elements:
+            if rpr is not body_rpr or run_element.rPr is not None:
+                _apply_rpr_template(run_element, rpr)
+
+        if rpr is not body_rpr and rpr is not shared_body_rpr:
+            p.alignment = left
 
     # Format tables with APA style
     print("Applying APA table formatting...")
@@ -291,49 +692,51 @@ def apply_formatting(input_file, output_file=None, config=None):
     table_number = 1
 
     # Process tables and their captions
-    # Strategy: Look for paragraphs with "Table" or table captions before each table
-    for i, element in enumerate(doc.element.body):
-        # Check if this is a table element
-        if element.tag.endswith('tbl'):
+    # Strategy: Look for paragraphs with "Table" or table captions before each table.
+    # Walk the body once, remembering the element just before each table;
+    # a caption paragraph is only wrapped when a table follows it.
+    tbl_map = {table._element: table for table in doc.tables}
+
+    prev_element = None
+    for element in doc.element.body:
+        table = tbl_map.get(element)
+        if table is not None:
             table_count += 1
 
-            # Get the table object
-            for table in doc.tables:
-                if table._element == element:
-                    # Look for caption in previous paragraph
-                    if i > 0:
-                        prev_element = doc.element.body[i - 1]
-                        if prev_element.tag.endswith('p'):
-                            # Find the corresponding paragraph object
-                            for para in doc.paragraphs:
-                                if para._element == prev_element:
-                                    text = para.text.strip().lower()
-                                    # Check if this looks like a table caption
-                                    if (text.startswith('table') or
-                                        para.style.name == 'Caption' or
-                                        'caption' in para.style.name.lower()):
-                                        format_table_caption(para, table_number, cfg)
-
-                    # Apply APA table style
-                    apply_apa_table_style(table, cfg)
-                    table_number += 1
-                    break
+            # Look for caption in previous paragraph
+            if prev_element is not None and prev_element.tag == _QN['p']:
+                prev_para = Paragraph(prev_element, doc._body)
+                # Check if this looks like a table caption ("Table ..." or
+                # a Caption-style paragraph); only the leading word matters
+                prefix = prev_para.text.lstrip()[:5].lower()
+                if (prefix == 'table' or
+                    'caption' in prev_para.style.name.lower()):
+                    format_table_caption(prev_para, table_number, cfg)
+
+            # Apply APA table style
+            apply_apa_table_style(table, cfg)
+            table_number += 1
+
+        prev_element = element
 
     # Save document
     print(f"Saving: {output_file}")
-    doc.save(output_file)
-
-    print()
-    print("=" * 60)
-    print("✓ Formatting applied successfully!")
-    print("=" * 60)
-    print(f"Processed: {paragraph_count} paragraphs, {table_count} tables")
-    print(f"Font:      {cfg['font']}, {cfg['font_size']}pt")
-    print(f"Title:     {cfg['title_size']}pt, Bold, Black")
-    print(f"Heading 1: {cfg['heading1_size']}pt, Bold, Black")
-    print(f"Heading 2: {cfg['heading2_size']}pt, Bold, Black")
-    print(f"Spacing:   {cfg['line_spacing']}")
-    print(f"Margins:   {cfg['margins']} inch")
-    print()
+    save_document(doc, output_file, cfg)
+
+    # Summary, written in one go
+    print("\n".join([
+        "",
+        "=" * 60,
+        "✓ Formatting applied successfully!",
+        "=" * 60,
+        f"Processed: {paragraph_count} paragraphs, {table_count} tables",
+        f"Font:      {cfg['font']}, {cfg['font_size']}pt",
+        f"Title:     {cfg['title_size']}pt, Bold, Black",
+        f"Heading 1: {cfg['heading1_size']}pt, Bold, Black",
+        f"Heading 2: {cfg['heading2_size']}pt, Bold, Black",
+        f"Spacing:   {cfg['line_spacing']}",
+        f"Margins:   {cfg['margins']} inch",
+        "",
+    ]))
 
     return True
@@ -3,11 +3,290 @@ Paper initialization module
 """
 
 import os
-from docx import Document
-from docx.shared import Pt, Inches, RGBColor
-from .config import DEFAULT_CONFIG, PAPER_SIZES
+import re
+from collections import ChainMap
+from functools import lru_cache
+from xml.sax.saxutils import escape
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from docx.shared import Emu, Length, Pt, Inches, RGBColor, Twips
+from docx.table import Table
+from .config import DEFAULT_CONFIG, get_paper_size
 from .templates import get_template
-from .formatter import apply_apa_table_style
+from .formatter import (apply_apa_table_style, format_styles, new_document,
+                        save_document)
+
+# Sample Introduction text: (text, font flags) for each run
+_CHEM_PARTS = (
+    ('Ocean acidification due to increased atmospheric CO', {}),
+    ('2', {'subscript': True}),                                   # CO2
+    (' concentrations affects calcium carbonate (CaCO', {}),
+    ('3', {'subscript': True}),                                   # CaCO3
+    (') saturation states. The pH of surface waters has decreased, '
+     'with measurements showing changes in HCO', {}),
+    ('3', {'subscript': True}),                                   # HCO3-
+    ('−', {'superscript': True}),
+    (' and CO', {}),
+    ('3', {'subscript': True}),                                   # CO3 2-
+    ('2−', {'superscript': True}),
+    (' concentrations across different ocean regions.', {}),
+)
+
+# Section title keyword -> placeholder text (first match wins)
+_PLACEHOLDER_RULES = (
+    ('abstract', '[Write your abstract here. Typically 150-250 words.]'),
+    ('introduction', '[Introduce the research question and background.]'),
+    ('method', '[Describe your methodology.]'),
+    ('result', '[Present your findings.]'),
+    ('discussion', '[Interpret results and discuss implications.]'),
+    ('conclusion', '[Summarize main findings.]'),
+    ('reference', '[References will be added here.]'),
+    ('competing', 'The authors declare no competing interests.'),
+    ('conflict', 'The authors declare no competing interests.'),
+)
+
+# Sections used when neither the template nor the config lists any
+_DEFAULT_SECTIONS = (
+    'Abstract', 'Introduction', 'Methods', 'Results',
+    'Discussion', 'Conclusions', 'Acknowledgements',
+    'Data Availability', 'Author Contributions',
+    'Competing Interests', 'References'
+)
+
+# Example figure shipped in static/, resolved once (None if missing)
+_EXAMPLE_IMAGE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                              '..', 'static', 'example.png')
+if not os.path.isfile(_EXAMPLE_IMAGE):
+    _EXAMPLE_IMAGE = None
+
+# Field markup, parsed per use by _begin_field/_end_field
+_FLDCHAR_XML = '<w:fldChar %s w:fldCharType="{}"/>' % nsdecls('w')
+_INSTR_XML = '<w:instrText %s xml:space="preserve">{}</w:instrText>' % nsdecls('w')
+
+# Static body markup, filled in with str.format and parsed by _append_body_xml.
+# {ppr} is the spacing w:pPr from _spacing_ppr_xml, {title}/{heading}/{text}
+# are run content from _run_content_xml, sizes are in half-points.
+_FRONT_MATTER_XML = (
+    '<w:p>{ppr}'
+    '<w:r><w:rPr><w:rFonts w:ascii="{font}" w:hAnsi="{font}"/><w:b/>'
+    '<w:color w:val="000000"/><w:sz w:val="{title_sz}"/><w:u w:val="none"/>'
+    '</w:rPr>{title}</w:r></w:p>'
+    '<w:p>{ppr}'
+    '<w:r><w:t>Author Name¹, Second Author², Third Author¹</w:t></w:r></w:p>'
+    '<w:p/>'
+    '<w:p>{ppr}'
+    '<w:r><w:rPr><w:rFonts w:ascii="{font}" w:hAnsi="{font}"/>'
+    '<w:color w:val="000000"/><w:sz w:val="{small_sz}"/></w:rPr>'
+    '<w:t>¹ School of Environmental Sciences, University of East Anglia, '
+    'Norwich, UK</w:t><w:br/>'
+    '<w:t>² Department, Institution, City, Country</w:t></w:r></w:p>'
+    '<w:p/>'
+)
+_SAMPLE_SECTIONS = ('introduction', 'method', 'result')
+_SECTION_XML = (
+    '<w:p><w:pPr><w:pStyle w:val="Heading1"/></w:pPr>'
+    '<w:r>{heading}</w:r></w:p>'
+    '<w:p>{ppr}'
+    '<w:r>{text}</w:r></w:p>'
+)
+
+# Sample Results table (header row first) and its markup
+_RESULTS_ROWS = (
+    ('Variable', 'M', 'SD', 'N'),
+    ('Age', '35.2', '8.4', '120'),
+    ('Experience (years)', '10.5', '4.2', '120'),
+    ('Performance Score', '78.3', '12.1', '120'),
+)
+_TBL_XML = (
+    '<w:tbl %s><w:tblPr><w:tblW w:type="auto" w:w="0"/>'
+    '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" '
+    'w:lastRow="0" w:noHBand="0" w:noVBand="1" w:val="04A0"/></w:tblPr>'
+    '<w:tblGrid>{grid}</w:tblGrid>{rows}</w:tbl>' % nsdecls('w')
+)
+_GRID_COL_XML = '<w:gridCol w:w="{width}"/>'
+_TC_XML = (
+    '<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{width}"/></w:tcPr>'
+    '<w:p><w:r><w:t>{text}</w:t></w:r></w:p></w:tc>'
+)
+
+_RUN_SPECIAL_CHARS = re.compile(r'([\t\n\r])')
+_BODY_WRAPPER = '<w:body %s>{}</w:body>' % nsdecls('w')
+
+
+def _run_content_xml(text):
+    """
+    Render text as the content of a w:r, the way Run.text does.
+
+    Tabs become w:tab, line breaks w:br; text with leading or trailing
+    whitespace is marked xml:space="preserve".
+
+    Args:
+        text: Plain text
+
+    Returns:
+        str: w:t/w:tab/w:br elements
+    """
+    parts = []
+    for piece in _RUN_SPECIAL_CHARS.split(text):
+        if piece == '\t':
+            parts.append('<w:tab/>')
+        elif piece in ('\n', '\r'):
+            parts.append('<w:br/>')
+        elif piece:
+            space = ' xml:space="preserve"' if piece.strip() != piece else ''
+            parts.append(f'<w:t{space}>{escape(piece)}</w:t>')
+    return ''.join(parts)
+
+
+def _spacing_ppr_xml(line_spacing):
+    """
+    Render a line spacing value as w:pPr, the way ParagraphFormat does.
+
+    Args:
+        line_spacing: Multiple of single spacing, a Length (exact height)
+                      or None
+
+    Returns:
+        str: w:pPr element
+    """
+    if line_spacing is None:
+        return '<w:pPr/>'
+    if isinstance(line_spacing, Length):
+        line, rule = line_spacing.twips, 'exact'
+    else:
+        line, rule = Emu(line_spacing * Twips(240)).twips, 'auto'
+    return f'<w:pPr><w:spacing w:line="{line}" w:lineRule="{rule}"/></w:pPr>'
+
+
+def _append_body_xml(doc, xml):
+    """
+    Parse a run of body-level XML and append it to the document.
+
+    The elements go before the final w:sectPr, where doc.add_paragraph
+    would put them.
+
+    Args:
+        doc: python-docx Document object
+        xml: Concatenated w:p elements without namespace declarations
+    """
+    body = doc.element.body
+    sect_pr = body.sectPr
+    for element in list(parse_xml(_BODY_WRAPPER.format(xml))):
+        if sect_pr is not None:
+            sect_pr.addprevious(element)
+        else:
+            body.append(element)
+
+
+def _add_text_table(doc, rows):
+    """
+    Append a table of plain text cells, built with a single XML parse.
+
+    Produces the same markup as doc.add_table followed by setting
+    cell.text on every cell: columns share the text width evenly.
+
+    Args:
+        doc: python-docx Document object
+        rows: Sequence of equal-length rows of cell strings
+
+    Returns:
+        python-docx Table object
+    """
+    width = Emu(doc._block_width // len(rows[0])).twips
+    tbl = parse_xml(_TBL_XML.format(
+        grid=_GRID_COL_XML.format(width=width) * len(rows[0]),
+        rows=''.join(
+            '<w:tr>%s</w:tr>' % ''.join(
+                _TC_XML.format(width=width, text=escape(text)) for text in row)
+            for row in rows)))
+    doc.element.body._insert_tbl(tbl)
+    return Table(tbl, doc._body)
+
+
+@lru_cache(maxsize=32)
+def _resolve_sections(section_titles):
+    """
+    Pair each section title with its placeholder text.
+
+    Cached, so each template's section list is resolved only once.
+
+    Args:
+        section_titles: Tuple of section titles
+
+    Returns:
+        tuple: (section_title, placeholder_text) pairs
+    """
+    return tuple(
+        (section_title, next(
+            (text for keyword, text in _PLACEHOLDER_RULES
+             if keyword in section_title.lower()),
+            f'[Content for {section_title} section.]'
+        ))
+        for section_title in section_titles
+    )
+
+
+def _format_run(run, font=None, size=None, color=None, *, bold=False,
+                italic=False, subscript=False, superscript=False):
+    """
+    Set font properties on a run.
+
+    Properties left as None are inherited from the paragraph style.
+
+    Args:
+        run: python-docx Run object
+        font: Optional font name
+        size: Optional font size (docx.shared.Pt)
+        color: Optional RGBColor
+        bold, italic, subscript, superscript: Flags to switch on
+
+    Returns:
+        The run
+    """
+    f = run.font
+    if font is not None:
+        f.name = font
+    if size is not None:
+        f.size = size
+    if bold:
+        f.bold = True
+    if italic:
+        f.italic = True
+    if subscript:
+        f.subscript = True
+    if superscript:
+        f.superscript = True
+    if color is not None:
+        f.color.rgb = color
+    return run
+
+
+def _add_run(paragraph, text, font=None, size=None, color=None, **flags):
+    """Add a run with the given text and font properties to a paragraph."""
+    return _format_run(paragraph.add_run(text), font, size, color, **flags)
+
+
+def _begin_field(run, instr):
+    """
+    Open a Word field (e.g. SEQ or REF) at the end of a run.
+
+    Appends the begin marker, the field instruction and the separate
+    marker; the runs that follow hold the field's cached result until
+    _end_field closes it.
+
+    Args:
+        run: python-docx Run object
+        instr: Field instruction, e.g. 'SEQ Figure \\* ARABIC'
+    """
+    r = run._element
+    r.append(parse_xml(_FLDCHAR_XML.format('begin')))
+    r.append(parse_xml(_INSTR_XML.format(instr)))
+    r.append(parse_xml(_FLDCHAR_XML.format('separate')))
+
+
+def _end_field(run):
+    """Close the field opened by _begin_field at the end of a run."""
+    run._element.append(parse_xml(_FLDCHAR_XML.format('end')))
 
 
 def init_paper(title, output_file="paper.docx", config=None, template=None):
@@ -24,285 +303,115 @@ def init_paper(title, output_file="paper.docx", config=None, template=None):
         True if successful, False otherwise
     """
 
-    # Start with default config
-    cfg = DEFAULT_CONFIG.copy()
+    # Custom config overrides the journal template, which overrides the
+    # defaults; cfg is only read here, so the layers are chained, not copied
+    cfg = ChainMap(config or {}, get_template(template) if template else {},
+                   DEFAULT_CONFIG)
 
-    # Apply journal template if specified
-    if template:
-        template_config = get_template(template)
-        cfg.update(template_config)
+    print("\n".join([
+        "",
+        "=" * 60,
+        "Initializing New Academic Paper",
+        "=" * 60,
+        f"Title: {title}",
+        f"File:  {output_file}",
+        "",
+    ]))
 
-    # Apply custom config overrides
-    if config:
-        cfg.update(config)
+    margin = Inches(cfg['margins'])
 
-    print()
-    print("=" * 60)
-    print("Initializing New Academic Paper")
-    print("=" * 60)
-    print(f"Title: {title}")
-    print(f"File:  {output_file}")
-    print()
-
-    # Create document
-    doc = Document()
+    # Create document; body and heading fonts are set on the styles
+    doc = new_document()
+    format_styles(doc, cfg)
 
     # Set page size and margins
+    paper_size = cfg.get('paper_size', 'a4')
     for section in doc.sections:
-        # Get paper size from config
-        paper_size = cfg.get('paper_size', 'a4')
-        if paper_size in PAPER_SIZES:
-            width, height = PAPER_SIZES[paper_size]
-            section.page_width = Inches(width)
-            section.page_height = Inches(height)
-        else:
-            # Default to A4 if invalid
-            section.page_width = Inches(8.27)
-            section.page_height = Inches(11.69)
+        # Get paper size from config (defaults to A4 if invalid)
+        section.page_width, section.page_height = get_paper_size(paper_size)
 
         # Set margins
-        margin = Inches(cfg['margins'])
         section.top_margin = margin
         section.bottom_margin = margin
         section.left_margin = margin
         section.right_margin = margin
 
-    # Add Title
-    title_para = doc.add_paragraph()
-    title_run = title_para.add_run(title)
-    title_run.font.name = cfg['font']
-    title_run.font.size = Pt(cfg['title_size'])
-    title_run.font.bold = True
-    title_run.font.color.rgb = RGBColor(0, 0, 0)
-    title_run.font.underline = False  # Explicitly no underline
-    title_para.paragraph_format.line_spacing = cfg['line_spacing']
-
-    # Add Authors (placeholder)
-    author_para = doc.add_paragraph()
-    author_run = author_para.add_run("Author Name¹, Second Author², Third Author¹")
-    author_run.font.name = cfg['font']
-    author_run.font.size = Pt(cfg['font_size'])
-    author_run.font.color.rgb = RGBColor(0, 0, 0)
-    author_para.paragraph_format.line_spacing = cfg['line_spacing']
-
-    # Add affiliations
-    doc.add_paragraph()
-    affil_para = doc.add_paragraph()
-    affil_run = affil_para.add_run(
-        "¹ School of Environmental Sciences, University of East Anglia, Norwich, UK\n"
-        "² Department, Institution, City, Country"
-    )
-    affil_run.font.name = cfg['font']
-    affil_run.font.size = Pt(cfg['font_size'] - 1)
-    affil_run.font.color.rgb = RGBColor(0, 0, 0)
-    affil_para.paragraph_format.line_spacing = cfg['line_spacing']
+    # Add title, authors and affiliations in one parse
+    ppr = _spacing_ppr_xml(cfg['line_spacing'])
+    _append_body_xml(doc, _FRONT_MATTER_XML.format(
+        title=_run_content_xml(title),
+        font=escape(cfg['font'], {'"': '&quot;'}),
+        title_sz=int(round(cfg['title_size'] * 2)),
+        small_sz=int(round((cfg['font_size'] - 1) * 2)), ppr=ppr))
 
-    doc.add_paragraph()
-
-    # Get sections from template or use default
-    if 'sections' in cfg:
-        section_titles = cfg['sections']
-    else:
-        section_titles = [
-            'Abstract', 'Introduction', 'Methods', 'Results',
-            'Discussion', 'Conclusions', 'Acknowledgements',
-            'Data Availability', 'Author Contributions',
-            'Competing Interests', 'References'
-        ]
-
-    # Create section list with placeholders
-    sections = []
-    for section_title in section_titles:
-        if section_title.lower() == 'abstract':
-            placeholder = '[Write your abstract here. Typically 150-250 words.]'
-        elif 'introduction' in section_title.lower():
-            placeholder = '[Introduce the research question and background.]'
-        elif 'method' in section_title.lower():
-            placeholder = '[Describe your methodology.]'
-        elif 'result' in section_title.lower():
-            placeholder = '[Present your findings.]'
-        elif 'discussion' in section_title.lower():
-            placeholder = '[Interpret results and discuss implications.]'
-        elif 'conclusion' in section_title.lower():
-            placeholder = '[Summarize main findings.]'
-        elif 'reference' in section_title.lower():
-            placeholder = '[References will be added here.]'
-        elif 'competing' in section_title.lower() or 'conflict' in section_title.lower():
-            placeholder = 'The authors declare no competing interests.'
-        else:
-            placeholder = f'[Content for {section_title} section.]'
-        sections.append((section_title, placeholder))
+    # Get sections from template or use default, with their placeholders
+    sections = _resolve_sections(tuple(cfg.get('sections', _DEFAULT_SECTIONS)))
 
+    # Plain placeholder sections are collected as XML and parsed in one go;
+    # the sample sections below are built through python-docx
+    plain_xml = []
     for section_title, placeholder_text in sections:
+        title_lower = section_title.lower()
+        if not any(key in title_lower for key in _SAMPLE_SECTIONS):
+            plain_xml.append(_SECTION_XML.format(
+                heading=_run_content_xml(section_title),
+                text=_run_content_xml(placeholder_text), ppr=ppr))
+            continue
+
+        if plain_xml:
+            _append_body_xml(doc, ''.join(plain_xml))
+            plain_xml = []
+
         # Add heading
-        heading = doc.add_heading(section_title, level=1)
-        for run in heading.runs:
-            run.font.name = cfg['font']
-            run.font.size = Pt(cfg['heading1_size'])
-            run.font.bold = True
-            run.font.color.rgb = RGBColor(0, 0, 0)
+        doc.add_heading(section_title, level=1)
 
         # Add sample text with chemical formulas in Introduction section
-        if 'introduction' in section_title.lower():
+        if 'introduction' in title_lower:
             chem_para = doc.add_paragraph()
             chem_para.paragraph_format.line_spacing = cfg['line_spacing']
 
             # Add text with chemical formulas
-            run1 = chem_para.add_run('Ocean acidification due to increased atmospheric CO')
-            run1.font.name = cfg['font']
-            run1.font.size = Pt(cfg['font_size'])
-            run1.font.color.rgb = RGBColor(0, 0, 0)
-
-            # CO2 subscript
-            run2 = chem_para.add_run('2')
-            run2.font.name = cfg['font']
-            run2.font.size = Pt(cfg['font_size'])
-            run2.font.subscript = True
-            run2.font.color.rgb = RGBColor(0, 0, 0)
-
-            run3 = chem_para.add_run(' concentrations affects calcium carbonate (CaCO')
-            run3.font.name = cfg['font']
-            run3.font.size = Pt(cfg['font_size'])
-            run3.font.color.rgb = RGBColor(0, 0, 0)
-
-            # CaCO3 subscript
-            run4 = chem_para.add_run('3')
-            run4.font.name = cfg['font']
-            run4.font.size = Pt(cfg['font_size'])
-            run4.font.subscript = True
-            run4.font.color.rgb = RGBColor(0, 0, 0)
-
-            run5 = chem_para.add_run(') saturation states. The pH of surface waters has decreased, with measurements showing changes in HCO')
-            run5.font.name = cfg['font']
-            run5.font.size = Pt(cfg['font_size'])
-            run5.font.color.rgb = RGBColor(0, 0, 0)
-
-            # HCO3- subscript and superscript
-            run6 = chem_para.add_run('3')
-            run6.font.name = cfg['font']
-            run6.font.size = Pt(cfg['font_size'])
-            run6.font.subscript = True
-            run6.font.color.rgb = RGBColor(0, 0, 0)
-
-            run7 = chem_para.add_run('−')
-            run7.font.name = cfg['font']
-            run7.font.size = Pt(cfg['font_size'])
-            run7.font.superscript = True
-            run7.font.color.rgb = RGBColor(0, 0, 0)
-
-            run8 = chem_para.add_run(' and CO')
-            run8.font.name = cfg['font']
-            run8.font.size = Pt(cfg['font_size'])
-            run8.font.color.rgb = RGBColor(0, 0, 0)
-
-            run9 = chem_para.add_run('3')
-            run9.font.name = cfg['font']
-            run9.font.size = Pt(cfg['font_size'])
-            run9.font.subscript = True
-            run9.font.color.rgb = RGBColor(0, 0, 0)
-
-            run10 = chem_para.add_run('2−')
-            run10.font.name = cfg['font']
-            run10.font.size = Pt(cfg['font_size'])
-            run10.font.superscript = True
-            run10.font.color.rgb = RGBColor(0, 0, 0)
-
-            run11 = chem_para.add_run(' concentrations across different ocean regions.')
-            run11.font.name = cfg['font']
-            run11.font.size = Pt(cfg['font_size'])
-            run11.font.color.rgb = RGBColor(0, 0, 0)
+            for text, flags in _CHEM_PARTS:
+                _add_run(chem_para, text, **flags)
 
         # Add subheadings for Methods section
-        elif 'method' in section_title.lower():
+        elif 'method' in title_lower:
             # Subheading: Study Area
-            subheading1 = doc.add_heading('Study Area', level=2)
-            for run in subheading1.runs:
-                run.font.name = cfg['font']
-                run.font.size = Pt(cfg['heading2_size'])
-                run.font.bold = True
-                run.font.color.rgb = RGBColor(0, 0, 0)
+            doc.add_heading('Study Area', level=2)
 
             sub_para1 = doc.add_paragraph('[Describe the study area and location.]')
             sub_para1.paragraph_format.line_spacing = cfg['line_spacing']
-            for run in sub_para1.runs:
-                run.font.name = cfg['font']
-                run.font.size = Pt(cfg['font_size'])
-                run.font.color.rgb = RGBColor(0, 0, 0)
 
             doc.add_paragraph()
 
             # Subheading: Data Collection
-            subheading2 = doc.add_heading('Data Collection', level=2)
-            for run in subheading2.runs:
-                run.font.name = cfg['font']
-                run.font.size = Pt(cfg['heading2_size'])
-                run.font.bold = True
-                run.font.color.rgb = RGBColor(0, 0, 0)
+            doc.add_heading('Data Collection', level=2)
 
             sub_para2 = doc.add_paragraph('[Describe data collection procedures.]')
             sub_para2.paragraph_format.line_spacing = cfg['line_spacing']
-            for run in sub_para2.runs:
-                run.font.name = cfg['font']
-                run.font.size = Pt(cfg['font_size'])
-                run.font.color.rgb = RGBColor(0, 0, 0)
 
         # Add sample table in Results section
-        elif 'result' in section_title.lower():
+        elif 'result' in title_lower:
             # Subheading: Descriptive Statistics
-            subheading_stats = doc.add_heading('Descriptive Statistics', level=2)
-            for run in subheading_stats.runs:
-                run.font.name = cfg['font']
-                run.font.size = Pt(cfg['heading2_size'])
-                run.font.bold = True
-                run.font.color.rgb = RGBColor(0, 0, 0)
+            doc.add_heading('Descriptive Statistics', level=2)
 
             # Add table caption
-            caption = doc.add_paragraph('Sample Descriptive Statistics')
-            caption_run = caption.runs[0]
-            caption_run.font.name = cfg['font']
-            caption_run.font.size = Pt(cfg['font_size'])
-            caption_run.font.bold = True
-            caption_run.font.italic = True
-            caption_run.font.color.rgb = RGBColor(0, 0, 0)
-            caption_run.text = 'Table 1\nSample Descriptive Statistics'
+            caption = doc.add_paragraph()
+            _add_run(caption, 'Table 1\nSample Descriptive Statistics',
+                     bold=True, italic=True)
             caption.paragraph_format.space_before = Pt(12)
             caption.paragraph_format.space_after = Pt(0)
 
             # Create sample table
-            table = doc.add_table(rows=4, cols=4)
-
-            # Header row
-            header_cells = table.rows[0].cells
-            header_cells[0].text = 'Variable'
-            header_cells[1].text = 'M'
-            header_cells[2].text = 'SD'
-            header_cells[3].text = 'N'
-
-            # Data rows
-            data_rows = [
-                ('Age', '35.2', '8.4', '120'),
-                ('Experience (years)', '10.5', '4.2', '120'),
-                ('Performance Score', '78.3', '12.1', '120')
-            ]
-
-            for i, (var, mean, sd, n) in enumerate(data_rows, 1):
-                row = table.rows[i]
-                row.cells[0].text = var
-                row.cells[1].text = mean
-                row.cells[2].text = sd
-                row.cells[3].text = n
+            table = _add_text_table(doc, _RESULTS_ROWS)
 
             # Apply APA table formatting
             apply_apa_table_style(table, cfg)
 
             # Add note below table
             doc.add_paragraph()
-            note = doc.add_paragraph('Note. M = Mean; SD = Standard Deviation; N = Sample size.')
-            note_run = note.runs[0]
-            note_run.font.name = cfg['font']
-            note_run.font.size = Pt(cfg['font_size'])
-            note_run.font.italic = True
-            note_run.font.color.rgb = RGBColor(0, 0, 0)
+            note = doc.add_paragraph()
+            _add_run(note, 'Note. M = Mean; SD = Standard Deviation; N = Sample size.', italic=True)
             note.paragraph_format.space_before = Pt(0)
             note.paragraph_format.space_after = Pt(6)
 
@@ -311,81 +420,36 @@ def init_paper(title, output_file="paper.docx", config=None, template=None):
             doc.add_paragraph()
 
             # Subheading: Spatial Patterns
-            subheading_spatial = doc.add_heading('Spatial Patterns', level=2)
-            for run in subheading_spatial.runs:
-                run.font.name = cfg['font']
-                run.font.size = Pt(cfg['heading2_size'])
-                run.font.bold = True
-                run.font.color.rgb = RGBColor(0, 0, 0)
+            doc.add_heading('Spatial Patterns', level=2)
 
             # Add figure image
             fig_para = doc.add_paragraph()
             fig_para.paragraph_format.alignment = 1  # Center alignment
 
-            # Get path to example image
-            package_dir = os.path.dirname(os.path.abspath(__file__))
-            image_path = os.path.join(package_dir, '..', 'static', 'example.png')
-
-            # Add image if it exists, otherwise use placeholder text
-            if os.path.exists(image_path):
+            # Add example image if it exists, otherwise use placeholder text
+            if _EXAMPLE_IMAGE:
                 fig_run = fig_para.add_run()
-                fig_run.add_picture(image_path, width=Inches(5.0))
+                fig_run.add_picture(_EXAMPLE_IMAGE, width=Inches(5.0))
             else:
-                fig_run = fig_para.add_run('[Insert figure here]')
-                fig_run.font.name = cfg['font']
-                fig_run.font.size = Pt(cfg['font_size'])
-                fig_run.font.color.rgb = RGBColor(128, 128, 128)  # Gray text
-                fig_run.font.italic = True
+                _add_run(fig_para, '[Insert figure here]',
+                         color=RGBColor(128, 128, 128), italic=True)  # Gray text
 
             # Add figure caption with SEQ field for auto-numbering
-            from docx.oxml import OxmlElement
-            from docx.oxml.ns import qn
-
             fig_caption = doc.add_paragraph()
             fig_caption.paragraph_format.alignment = 1  # Center alignment
             fig_caption.paragraph_format.space_before = Pt(6)
             fig_caption.paragraph_format.space_after = Pt(12)
 
             # Add "Figure " text
-            caption_run = fig_caption.add_run('Figure ')
-            caption_run.font.name = cfg['font']
-            caption_run.font.size = Pt(cfg['font_size'])
-            caption_run.font.italic = True
-
-            # Add SEQ field for auto-numbering
-            fldChar1 = OxmlElement('w:fldChar')
-            fldChar1.set(qn('w:fldCharType'), 'begin')
-
-            instrText = OxmlElement('w:instrText')
-            instrText.set(qn('xml:space'), 'preserve')
-            instrText.text = 'SEQ Figure \\* ARABIC'
-
-            fldChar2 = OxmlElement('w:fldChar')
-            fldChar2.set(qn('w:fldCharType'), 'separate')
-
-            # Add placeholder for the number
-            num_run = fig_caption.add_run('1')
-            num_run.font.name = cfg['font']
-            num_run.font.size = Pt(cfg['font_size'])
-            num_run.font.italic = True
-
-            fldChar3 = OxmlElement('w:fldChar')
-            fldChar3.set(qn('w:fldCharType'), 'end')
+            caption_run = _add_run(fig_caption, 'Figure ', italic=True)
 
-            # Insert field elements into the first run
-            r_element = caption_run._element
-            r_element.append(fldChar1)
-            r_element.append(instrText)
-            r_element.append(fldChar2)
-
-            # Insert end field char after the number run
-            num_run._element.append(fldChar3)
+            # Add SEQ field for auto-numbering, with '1' as its placeholder
+            _begin_field(caption_run, 'SEQ Figure \\* ARABIC')
+            num_run = _add_run(fig_caption, '1', italic=True)
+            _end_field(num_run)
 
             # Add caption text
-            text_run = fig_caption.add_run('. Sample surface water temperature map')
-            text_run.font.name = cfg['font']
-            text_run.font.size = Pt(cfg['font_size'])
-            text_run.font.italic = True
+            _add_run(fig_caption, '. Sample surface water temperature map', italic=True)
 
             # Add example paragraph with cross-reference to the figure
             doc.add_paragraph()
@@ -393,77 +457,41 @@ def init_paper(title, output_file="paper.docx", config=None, template=None):
             ref_para.paragraph_format.line_spacing = cfg['line_spacing']
 
             # Add text before the reference
-            ref_run1 = ref_para.add_run('The surface water temperature data shows significant variation across regions (see ')
-            ref_run1.font.name = cfg['font']
-            ref_run1.font.size = Pt(cfg['font_size'])
-            ref_run1.font.color.rgb = RGBColor(0, 0, 0)
+            ref_run1 = _add_run(ref_para, 'The surface water temperature data shows significant variation across regions (see ')
 
             # Add cross-reference field to the figure
-            fldChar1 = OxmlElement('w:fldChar')
-            fldChar1.set(qn('w:fldCharType'), 'begin')
-
-            instrText = OxmlElement('w:instrText')
-            instrText.set(qn('xml:space'), 'preserve')
-            instrText.text = 'REF _Ref1 \\h'
-
-            fldChar2 = OxmlElement('w:fldChar')
-            fldChar2.set(qn('w:fldCharType'), 'separate')
-
-            # Add placeholder for the reference text
-            ref_run2 = ref_para.add_run('Figure 1')
-            ref_run2.font.name = cfg['font']
-            ref_run2.font.size = Pt(cfg['font_size'])
-            ref_run2.font.color.rgb = RGBColor(0, 0, 0)
-
-            fldChar3 = OxmlElement('w:fldChar')
-            fldChar3.set(qn('w:fldCharType'), 'end')
-
-            # Insert field elements
-            ref_run1._element.append(fldChar1)
-            ref_run1._element.append(instrText)
-            ref_run1._element.append(fldChar2)
-            ref_run2._element.append(fldChar3)
+            _begin_field(ref_run1, 'REF _Ref1 \\h')
+            ref_run2 = _add_run(ref_para, 'Figure 1')
+            _end_field(ref_run2)
 
             # Add text after the reference
-            ref_run3 = ref_para.add_run('), with temperatures ranging from 0°C to 30°C.')
-            ref_run3.font.name = cfg['font']
-            ref_run3.font.size = Pt(cfg['font_size'])
-            ref_run3.font.color.rgb = RGBColor(0, 0, 0)
+            _add_run(ref_para, '), with temperatures ranging from 0°C to 30°C.')
 
             # Add IPCC paragraph with degree symbols
             doc.add_paragraph()
-            ipcc_para = doc.add_paragraph()
-            ipcc_para.paragraph_format.line_spacing = cfg['line_spacing']
-
             ipcc_text = 'The likely range of total human-caused global surface temperature increase from 1850–1900 to 2010–2019 is 0.8°C to 1.3°C, with a best estimate of 1.07°C. It is likely that well-mixed GHGs contributed a warming of 1.0°C to 2.0°C, other human drivers (principally aerosols) contributed a cooling of 0.0°C to 0.8°C, natural drivers changed global surface temperature by –0.1°C to +0.1°C, and internal variability changed it by –0.2°C to +0.2°C. It is very likely that well-mixed GHGs were the main driver of tropospheric warming since 1979 and extremely likely that human-caused stratospheric ozone depletion was the main driver of cooling of the lower stratosphere between 1979 and the mid-1990s.'
 
-            ipcc_run = ipcc_para.add_run(ipcc_text)
-            ipcc_run.font.name = cfg['font']
-            ipcc_run.font.size = Pt(cfg['font_size'])
-            ipcc_run.font.color.rgb = RGBColor(0, 0, 0)
+            ipcc_para = doc.add_paragraph(ipcc_text)
+            ipcc_para.paragraph_format.line_spacing = cfg['line_spacing']
 
-        # Add placeholder for all other sections
-        else:
-            para = doc.add_paragraph(placeholder_text)
-            para.paragraph_format.line_spacing = cfg['line_spacing']
-            for run in para.runs:
-                run.font.name = cfg['font']
-                run.font.size = Pt(cfg['font_size'])
-                run.font.color.rgb = RGBColor(0, 0, 0)
+    if plain_xml:
+        _append_body_xml(doc, ''.join(plain_xml))
 
     # Save
-    doc.save(output_file)
-
-    print("✓ Paper initialized successfully!")
-    print()
-    print("Sections created:")
-    for section_title, _ in sections:
-        print(f"  • {section_title}")
-    print()
-    print(f"Font:     {cfg['font']}, {cfg['font_size']}pt")
-    print(f"Spacing:  {cfg['line_spacing']}")
-    print(f"Margins:  {cfg['margins']} inch")
-    print(f"Includes: Sample APA-formatted table and figure in Results section")
-    print()
+    save_document(doc, output_file, cfg)
+
+    # Summary, written in one go
+    print("\n".join([
+        "✓ Paper initialized successfully!",
+        "",
+        "Sections created:",
+        *(f"  • {section_title}" for section_title, _ in sections),
+        "",
+        f"Font:     {cfg['font']}, {cfg['font_size']}pt",
+        f"Spacing:  {cfg['line_spacing']}",
+        f"Margins:  {cfg['margins']} inch",
+        "Includes: Sample APA-formatted table and figure in Results section",
+        "",
+    ]))
 
     return True
@@ -5,8 +5,10 @@ Similar to Quarto journal templates, provides formatting
 configurations for major academic journals.
 """
 
-# Journal template configurations
-JOURNAL_TEMPLATES = {
+from types import MappingProxyType
+
+# Journal template configurations (frozen into JOURNAL_TEMPLATES below)
+_RAW_TEMPLATES = {
     'agu': {
         'name': 'American Geophysical Union (AGU)',
         'font': 'Times New Roman',
@@ -144,6 +146,12 @@ JOURNAL_TEMPLATES = {
     },
 }
 
+# Read-only views, built once at import; 'sections' becomes a tuple
+JOURNAL_TEMPLATES = {
+    key: MappingProxyType({**config, 'sections': tuple(config['sections'])})
+    for key, config in _RAW_TEMPLATES.items()
+}
+
 
 def get_template(template_name):
     """
@@ -153,7 +161,8 @@ def get_template(template_name):
         template_name: Name of the template (e.g., 'agu', 'nature', 'science')
 
     Returns:
-        dict: Template configuration
+        Mapping: Read-only template configuration (copy it with dict()
+        before modifying)
 
     Raises:
         ValueError: If template name is not found
@@ -167,7 +176,7 @@ def get_template(template_name):
             f"Available templates: {available}"
         )
 
-    return JOURNAL_TEMPLATES[template_name].copy()
+    return JOURNAL_TEMPLATES[template_name]
 
 
 def list_templates():